@@ -0,0 +1,450 @@
+"""
+Async (ASGI) serving mode for the Halloween Costume Contest.
+
+Serves the same routes as app.py, but on Quart so one process can hold
+thousands of open connections (slow phones, polling results pages and the
+live /api/stream feed) without tying up a worker per connection.
+
+Contest data is loaded once at startup and kept in memory; every request
+reads and updates that single copy, and changes are flushed to
+contest_data.json in the background. Because the state lives in memory,
+run exactly ONE worker process:
+
+    hypercorn async_app:app --bind 0.0.0.0:$PORT --workers 1
+"""
+
+from quart import Quart, render_template, request, jsonify, send_from_directory, Response
+import asyncio
+import csv
+import json
+import os
+import shutil
+from datetime import datetime
+from io import StringIO
+from werkzeug.utils import secure_filename
+import aiofiles
+import aiofiles.os
+import secrets
+
+from app import (
+    DATA_DIR,
+    UPLOAD_FOLDER,
+    DATA_FILE,
+    BACKUP_DIR,
+    allowed_file,
+)
+
+app = Quart(__name__)
+
+app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['SECRET_KEY'] = secrets.token_hex(16)
+
+# Seconds between keep-alive comments on /api/stream (stops proxies from
+# closing idle connections)
+STREAM_KEEPALIVE = 15
+
+
+def empty_data():
+    return {
+        'entries': [],
+        'votes': {},
+        'settings': {
+            'show_votes': False,
+            'voting_enabled': True
+        }
+    }
+
+
+class ContestState:
+    """Single shared in-memory copy of the contest data"""
+
+    def __init__(self):
+        self.data = empty_data()
+        self.voter_entry = {}  # voter_id -> entry_id, for O(1) vote changes
+        self.lock = asyncio.Lock()
+        self.save_lock = asyncio.Lock()  # held for a whole save; take it before `lock`
+        self.version = 0
+        self._payload = None
+        self._payload_version = -1
+        self._dirty = asyncio.Event()
+        self._changed = asyncio.Condition()
+        self._saver = None
+
+    async def load(self):
+        """Load contest data from JSON file"""
+        if await aiofiles.os.path.exists(DATA_FILE):
+            async with aiofiles.open(DATA_FILE, 'r') as f:
+                self.data = json.loads(await f.read())
+        else:
+            self.data = empty_data()
+        self.voter_entry = {
+            voter_id: entry_id
+            for entry_id, voters in self.data['votes'].items()
+            for voter_id in voters
+        }
+        self.version += 1
+
+    async def changed(self):
+        """Mark data as modified: schedule a save and wake up streams"""
+        self.version += 1
+        self._dirty.set()
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def wait_for_change(self, version, timeout):
+        """Wait until the data is newer than `version` (or timeout)"""
+        async with self._changed:
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait_for(lambda: self.version != version),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                pass
+        return self.version
+
+    def entries_payload(self):
+        """JSON body for /api/entries, rebuilt only when the data changes"""
+        if self._payload_version != self.version:
+            entries = [
+                dict(entry, vote_count=len(self.data['votes'].get(entry['id'], [])))
+                for entry in self.data['entries']
+            ]
+            self._payload = json.dumps({
+                'entries': entries,
+                'settings': self.data['settings']
+            })
+            self._payload_version = self.version
+        return self._payload
+
+    async def save(self):
+        """Write the current data to the JSON file"""
+        async with self.save_lock:
+            async with self.lock:
+                contents = json.dumps(self.data, indent=2)
+            tmp_file = DATA_FILE + '.tmp'
+            async with aiofiles.open(tmp_file, 'w') as f:
+                await f.write(contents)
+            await aiofiles.os.replace(tmp_file, DATA_FILE)
+
+    async def saver(self):
+        """Background task: flush changes to disk, coalescing bursts of votes"""
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            try:
+                # Shielded so shutdown never interrupts a write halfway through
+                await asyncio.shield(self.save())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️  Failed to save contest data: {e}")
+                self._dirty.set()  # Retry shortly
+                await asyncio.sleep(1)
+
+    def start(self):
+        self._saver = asyncio.create_task(self.saver())
+
+    async def stop(self):
+        """Stop the background saver and write any pending changes"""
+        if self._saver is not None:
+            self._saver.cancel()
+            try:
+                await self._saver
+            except asyncio.CancelledError:
+                pass
+        self._dirty.clear()
+        await self.save()
+
+
+state = ContestState()
+
+
+async def backup_data():
+    """Create a backup of contest data"""
+    await aiofiles.os.makedirs(BACKUP_DIR, exist_ok=True)
+
+    # Create timestamped backup
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    backup_file = os.path.join(BACKUP_DIR, f'contest_backup_{timestamp}.json')
+
+    async with state.lock:
+        contents = json.dumps(state.data, indent=2)
+    async with aiofiles.open(backup_file, 'w') as f:
+        await f.write(contents)
+
+    # Keep only last 10 backups
+    backups = sorted([f for f in await aiofiles.os.listdir(BACKUP_DIR) if f.startswith('contest_backup_')])
+    if len(backups) > 10:
+        for old_backup in backups[:-10]:
+            await aiofiles.os.remove(os.path.join(BACKUP_DIR, old_backup))
+
+
+@app.before_serving
+async def startup():
+    await state.load()
+    state.start()
+
+
+@app.after_serving
+async def shutdown():
+    await state.stop()
+
+
+@app.route('/')
+async def index():
+    """Main page - shows participate and vote options"""
+    return await render_template('index.html')
+
+@app.route('/participate')
+async def participate():
+    """Page for submitting entries"""
+    return await render_template('participate.html')
+
+@app.route('/vote')
+async def vote():
+    """Page for voting on entries"""
+    return await render_template('vote.html')
+
+@app.route('/results')
+async def results():
+    """Page showing contest results"""
+    return await render_template('results.html')
+
+@app.route('/admin')
+async def admin():
+    """Admin page for backup and data management"""
+    return await render_template('admin.html')
+
+@app.route('/api/entries', methods=['GET'])
+async def get_entries():
+    """Get all contest entries"""
+    return Response(state.entries_payload(), mimetype='application/json')
+
+@app.route('/api/stream')
+async def stream():
+    """Live results feed (Server-Sent Events) - pushes entries on every change"""
+    async def events():
+        version = state.version
+        yield f"data: {state.entries_payload()}\n\n".encode()
+        while True:
+            new_version = await state.wait_for_change(version, STREAM_KEEPALIVE)
+            if new_version == version:
+                yield b": keep-alive\n\n"
+            else:
+                version = new_version
+                yield f"data: {state.entries_payload()}\n\n".encode()
+
+    response = Response(events(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    response.timeout = None  # Streams stay open for as long as the client wants
+    return response
+
+@app.route('/api/submit', methods=['POST'])
+async def submit_entry():
+    """Submit a new contest entry"""
+    try:
+        form = await request.form
+        files_data = await request.files
+
+        # Get form data
+        name = form.get('name', '').strip()
+        costume_name = form.get('costume_name', '').strip()
+        description = form.get('description', '').strip()
+
+        if not name or not costume_name:
+            return jsonify({'error': 'Name and costume name are required'}), 400
+
+        # Handle multiple file uploads
+        if 'photos' not in files_data:
+            return jsonify({'error': 'At least one photo is required'}), 400
+
+        files = files_data.getlist('photos')
+        if not files or all(f.filename == '' for f in files):
+            return jsonify({'error': 'No files selected'}), 400
+
+        # Save all valid photos
+        saved_filenames = []
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        for idx, file in enumerate(files):
+            if file and file.filename != '' and allowed_file(file.filename):
+                filename = secure_filename(file.filename)
+                # Add timestamp and index to avoid conflicts
+                filename = f"{timestamp}_{idx}_{filename}"
+                await file.save(os.path.join(app.config['UPLOAD_FOLDER'], filename))
+                saved_filenames.append(filename)
+
+        if not saved_filenames:
+            return jsonify({'error': 'No valid images uploaded. Please upload image files.'}), 400
+
+        async with state.lock:
+            # Create new entry
+            entry_id = str(len(state.data['entries']) + 1)
+            new_entry = {
+                'id': entry_id,
+                'name': name,
+                'costume_name': costume_name,
+                'description': description,
+                'photos': saved_filenames,  # Multiple photos now
+                'timestamp': datetime.now().isoformat()
+            }
+            state.data['entries'].append(new_entry)
+
+        await state.changed()
+
+        # Create automatic backup
+        await backup_data()
+
+        return jsonify({'success': True, 'entry': new_entry})
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/vote', methods=['POST'])
+async def submit_vote():
+    """Submit a vote for an entry"""
+    try:
+        vote_data = await request.get_json()
+        entry_id = vote_data.get('entry_id')
+        voter_id = vote_data.get('voter_id')  # Could be session ID or name
+
+        if not entry_id or not voter_id:
+            return jsonify({'error': 'Entry ID and voter ID required'}), 400
+
+        async with state.lock:
+            if not state.data['settings']['voting_enabled']:
+                return jsonify({'error': 'Voting is currently disabled'}), 403
+
+            votes = state.data['votes']
+
+            # Remove previous vote, if any
+            previous = state.voter_entry.get(voter_id)
+            if previous is not None and voter_id in votes.get(previous, []):
+                votes[previous].remove(voter_id)
+
+            # Add new vote
+            votes.setdefault(entry_id, [])
+            if voter_id not in votes[entry_id]:
+                votes[entry_id].append(voter_id)
+            state.voter_entry[voter_id] = entry_id
+
+        await state.changed()
+
+        return jsonify({'success': True})
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/settings', methods=['POST'])
+async def update_settings():
+    """Update contest settings (admin only)"""
+    try:
+        settings_data = await request.get_json()
+
+        async with state.lock:
+            settings = state.data['settings']
+
+            if 'show_votes' in settings_data:
+                settings['show_votes'] = settings_data['show_votes']
+
+            if 'voting_enabled' in settings_data:
+                settings['voting_enabled'] = settings_data['voting_enabled']
+
+            settings = dict(settings)
+
+        await state.changed()
+
+        return jsonify({'success': True, 'settings': settings})
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/uploads/<filename>')
+async def uploaded_file(filename):
+    """Serve uploaded files (missing files return 404)"""
+    return await send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+
+@app.route('/api/backup/download')
+async def download_backup():
+    """Download current contest data as JSON"""
+    try:
+        async with state.lock:
+            contents = json.dumps(state.data, indent=2)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        return Response(
+            contents,
+            mimetype='application/json',
+            headers={'Content-Disposition': f'attachment; filename=contest_data_{timestamp}.json'}
+        )
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/backup/export-csv')
+async def export_csv():
+    """Export contest data as CSV"""
+    try:
+        output = StringIO()
+
+        # Write entries
+        writer = csv.writer(output)
+        writer.writerow(['ID', 'Name', 'Costume Name', 'Description', 'Photo Count', 'Votes', 'Timestamp'])
+
+        async with state.lock:
+            for entry in state.data['entries']:
+                vote_count = len(state.data['votes'].get(entry['id'], []))
+                photo_count = len(entry.get('photos', [entry.get('photo', '')]))
+                writer.writerow([
+                    entry['id'],
+                    entry['name'],
+                    entry['costume_name'],
+                    entry.get('description', ''),
+                    photo_count,
+                    vote_count,
+                    entry['timestamp']
+                ])
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        return Response(
+            output.getvalue(),
+            mimetype='text/csv',
+            headers={'Content-Disposition': f'attachment; filename=contest_results_{timestamp}.csv'}
+        )
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/admin/reset', methods=['POST'])
+async def reset_contest():
+    """Reset all contest data (admin only)"""
+    try:
+        # Wait for any in-flight save so it can't bring the old data file back
+        async with state.save_lock, state.lock:
+            state.data = empty_data()
+            state.voter_entry = {}
+
+            # Delete the data file
+            if await aiofiles.os.path.exists(DATA_FILE):
+                await aiofiles.os.remove(DATA_FILE)
+
+            # Delete uploads and backups
+            for folder in (UPLOAD_FOLDER, BACKUP_DIR):
+                if await aiofiles.os.path.exists(folder):
+                    await asyncio.to_thread(shutil.rmtree, folder)
+                await aiofiles.os.makedirs(folder, exist_ok=True)
+
+        await state.changed()
+
+        return jsonify({'success': True, 'message': 'Contest reset successfully'})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+if __name__ == '__main__':
+    # Get port from environment variable (for cloud deployment) or use 5000
+    port = int(os.environ.get('PORT', 5000))
+
+    print(f"🎃 Async server starting on http://localhost:{port} (data: {DATA_DIR})")
+    app.run(host='0.0.0.0', port=port)
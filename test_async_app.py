@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for the async (ASGI) serving mode in async_app.py
+Runs against a throwaway data directory, so your contest data is untouched
+"""
+
+import asyncio
+import io
+import json
+import os
+import tempfile
+
+def test_async_app():
+    """Submit an entry, vote, change the vote and read the live stream"""
+
+    print("=" * 60)
+    print("🧪 TESTING ASYNC SERVING MODE")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        # DATA_DIR is read when app.py is imported, so set it first
+        old_data_dir = os.environ.get('DATA_DIR')
+        os.environ['DATA_DIR'] = data_dir
+        from quart.datastructures import FileStorage
+        import async_app
+        from async_app import app, state
+
+        # Point at the temp directory even if app.py was already imported
+        data_file = os.path.join(data_dir, 'contest_data.json')
+        async_app.DATA_FILE = data_file
+        async_app.BACKUP_DIR = os.path.join(data_dir, 'backups')
+        app.config['UPLOAD_FOLDER'] = os.path.join(data_dir, 'uploads')
+        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+
+        async def run_checks():
+            async with app.test_app() as test_app:
+                client = test_app.test_client()
+
+                # Test 1: Submit an entry
+                print("\n✓ Test 1: Submit Entry")
+                response = await client.post(
+                    '/api/submit',
+                    form={'name': 'Alice', 'costume_name': 'Vampire'},
+                    files={'photos': FileStorage(io.BytesIO(b'fake image'), filename='vampire.png')}
+                )
+                entry = (await response.get_json())['entry']
+                assert response.status_code == 200
+                await client.post(
+                    '/api/submit',
+                    form={'name': 'Bob', 'costume_name': 'Ghost'},
+                    files={'photos': FileStorage(io.BytesIO(b'fake image'), filename='ghost.png')}
+                )
+                print(f"   ✅ Entry {entry['id']} saved with photo {entry['photos'][0]}")
+
+                # Test 2: Uploaded photo is served
+                print("\n✓ Test 2: Serve Upload")
+                response = await client.get(f"/uploads/{entry['photos'][0]}")
+                assert response.status_code == 200
+                assert await response.get_data() == b'fake image'
+                assert (await client.get('/uploads/missing.png')).status_code == 404
+                print("   ✅ Photo served, missing photo returns 404")
+
+                async with client.request('/api/stream') as stream:
+                    await stream.send_complete()
+
+                    # Test 3: Stream sends current results on connect
+                    print("\n✓ Test 3: Live Stream")
+                    event = await stream.receive()
+                    first = json.loads(event.decode()[len('data: '):])
+                    assert [e['vote_count'] for e in first['entries']] == [0, 0]
+                    print("   ✅ Stream sent current results on connect")
+
+                    # Test 4: Vote, then change the vote
+                    print("\n✓ Test 4: Vote and Change Vote")
+                    await client.post('/api/vote', json={'entry_id': '1', 'voter_id': 'voter-1'})
+                    await client.post('/api/vote', json={'entry_id': '2', 'voter_id': 'voter-1'})
+                    entries = (await (await client.get('/api/entries')).get_json())['entries']
+                    counts = {e['id']: e['vote_count'] for e in entries}
+                    assert counts == {'1': 0, '2': 1}, counts
+                    assert state.voter_entry == {'voter-1': '2'}
+                    print("   ✅ Changing a vote moves it to the new entry")
+
+                    # Test 5: Stream pushed the change
+                    print("\n✓ Test 5: Stream Update")
+                    latest = None
+                    while True:
+                        event = await asyncio.wait_for(stream.receive(), 5)
+                        latest = json.loads(event.decode()[len('data: '):])
+                        if latest['entries'][1]['vote_count'] == 1:
+                            break
+                    assert latest['entries'][0]['vote_count'] == 0
+                    print("   ✅ Stream pushed the new vote counts")
+
+                    await stream.disconnect()
+
+        try:
+            asyncio.run(run_checks())
+        finally:
+            if old_data_dir is None:
+                os.environ.pop('DATA_DIR', None)
+            else:
+                os.environ['DATA_DIR'] = old_data_dir
+
+        # Test 6: Data reached the JSON file on shutdown
+        print("\n✓ Test 6: Saved to Disk")
+        with open(data_file, 'r') as f:
+            data = json.load(f)
+        assert len(data['entries']) == 2
+        assert data['votes'] == {'1': [], '2': ['voter-1']}
+        print(f"   ✅ {len(data['entries'])} entries and votes saved to contest_data.json")
+
+    print("\n" + "=" * 60)
+    print("✅ Async serving mode works!")
+    print("=" * 60)
+
+if __name__ == '__main__':
+    test_async_app()